@@ -12,8 +12,9 @@ import platform
 import hashlib
 import getpass
 import logging
+import time
 from datetime import datetime, timezone
-from typing import Optional, List, Tuple
+from typing import Callable, Dict, Optional, List, Tuple
 from pathlib import Path
 
 # Set up debug mode
@@ -97,6 +98,7 @@ class SecureTokenManager:
     
     CONFIG_VERSION = "1.0"
     CONFIG_FILENAME = "config.json"
+    INVALID_TOKEN_TTL = 60  # Seconds a rejected token is remembered as invalid
     
     def __init__(self):
         """Initialize the secure token manager."""
@@ -106,6 +108,13 @@ class SecureTokenManager:
         
         # Global flag to track if token was saved to config file during this session
         self._token_saved_to_config = False
+        
+        # Synchronous sleep between validation retries (override for tests or custom back-off);
+        # async callers should use a_get_validated_token rather than swapping in asyncio.sleep
+        self._sleep: Callable[[float], None] = time.sleep
+        
+        # sha256(token) -> monotonic time the API rejected it
+        self._invalid_cache: Dict[str, float] = {}
     
     def get_secure_token(self) -> str:
         """
@@ -612,16 +621,28 @@ class SecureTokenManager:
         Returns:
             dict: User info if token is valid, None otherwise
         """
-        import time
         import ssl
         import urllib3
         import requests
         
+        verbose = DEBUG_MODE or diagnose_mode
+        
         if not token or len(token) < 30:
-            if DEBUG_MODE or diagnose_mode:
+            if verbose:
                 logger.debug("Token validation failed: Token is empty or too short")
             return None
         
+        # Skip the API round-trip for tokens recently rejected as unauthorized;
+        # diagnose mode always hits the API so the user sees the real response
+        token_key = hashlib.sha256(token.encode('utf-8')).hexdigest()
+        rejected_at = self._invalid_cache.get(token_key)
+        if rejected_at is not None and not diagnose_mode:
+            if time.monotonic() - rejected_at < self.INVALID_TOKEN_TTL:
+                if verbose:
+                    logger.debug("Token validation skipped: token was recently rejected by the API")
+                return None
+            del self._invalid_cache[token_key]
+        
         # Log Python and SSL information in diagnose mode
         if diagnose_mode:
             import platform
@@ -639,7 +660,7 @@ class SecureTokenManager:
         
         for attempt in range(max_retries):
             try:
-                if DEBUG_MODE or diagnose_mode:
+                if verbose:
                     logger.debug(f"Token validation attempt {attempt + 1}/{max_retries}")
                     if diagnose_mode:
                         msg.print_info(f"Attempt {attempt + 1}/{max_retries}: Validating token...")
@@ -702,13 +723,13 @@ class SecureTokenManager:
                 user_info = temp_client.get_authenticated_user()
                 
                 if user_info and 'id' in user_info:
-                    if DEBUG_MODE or diagnose_mode:
+                    if verbose:
                         logger.debug(f"Token validation successful for user: {user_info.get('name', 'Unknown')}")
                         if diagnose_mode:
                             msg.print_success(f"Token validated successfully: {user_info.get('name', 'Unknown')}")
                     return user_info
                 else:
-                    if DEBUG_MODE or diagnose_mode:
+                    if verbose:
                         logger.debug("Token validation failed: No user info returned or missing 'id' field")
                         if diagnose_mode:
                             msg.print_error("Token validation failed: Invalid response from API")
@@ -719,7 +740,7 @@ class SecureTokenManager:
                 error_str = str(e).lower()
                 error_type = type(e).__name__
                 
-                if DEBUG_MODE or diagnose_mode:
+                if verbose:
                     logger.debug(f"Token validation attempt {attempt + 1} failed: {str(e)}")
                     if diagnose_mode:
                         msg.print_error(f"Validation Error: {error_type}: {str(e)}")
@@ -737,14 +758,14 @@ class SecureTokenManager:
                 if any(keyword in error_str for keyword in ['timeout', 'connection', 'network', 'temporary', 'service unavailable', '502', '503', '504']):
                     if attempt < max_retries - 1:
                         wait_time = (attempt + 1) * 2  # Exponential backoff: 2s, 4s, 6s
-                        if DEBUG_MODE or diagnose_mode:
+                        if verbose:
                             logger.debug(f"Network error detected, retrying in {wait_time}s...")
                             if diagnose_mode:
                                 msg.print_info(f"Network error - retrying in {wait_time} seconds...")
-                        time.sleep(wait_time)
+                        self._sleep(wait_time)
                         continue
                     else:
-                        if DEBUG_MODE or diagnose_mode:
+                        if verbose:
                             logger.debug("Max retries reached for network errors")
                             if diagnose_mode:
                                 msg.print_error("Max retries reached for network errors")
@@ -752,27 +773,49 @@ class SecureTokenManager:
                 
                 # Check if it's an authentication error (expired/invalid token)
                 elif any(keyword in error_str for keyword in ['unauthorized', '401', 'forbidden', '403', 'invalid', 'expired']):
-                    if DEBUG_MODE or diagnose_mode:
+                    if verbose:
                         logger.debug("Authentication error detected - token is likely expired or invalid")
                         if diagnose_mode:
                             msg.print_error("Authentication error - token appears to be invalid or expired")
+                    if self._is_unauthorized_error(e, error_str):
+                        self._remember_invalid_token(token_key)
                     return None
                 
                 # For other errors, don't retry but log the specific error
                 else:
-                    if DEBUG_MODE or diagnose_mode:
+                    if verbose:
                         logger.debug(f"Unexpected validation error: {str(e)}")
                         if diagnose_mode:
                             msg.print_error(f"Unexpected error type: {error_type}")
                     return None
         
         # If we get here, all retries failed
-        if DEBUG_MODE or diagnose_mode:
+        if verbose:
             logger.debug("Token validation failed after all retry attempts")
             if diagnose_mode:
                 msg.print_error("Token validation failed after all retry attempts")
         return None
     
+    @staticmethod
+    def _is_unauthorized_error(error: Exception, error_str: str) -> bool:
+        """Whether a validation error is a genuine 401/403 rejection of the token."""
+        # QuipError exposes the HTTP status as .code; requests errors via .response
+        status = getattr(error, 'code', None)
+        if status is None:
+            status = getattr(getattr(error, 'response', None), 'status_code', None)
+        if isinstance(status, int):
+            return status in (401, 403)
+        return any(keyword in error_str for keyword in ['unauthorized', '401', 'forbidden', '403'])
+    
+    def _remember_invalid_token(self, token_key: str):
+        """Record a rejected token, purging entries older than the TTL."""
+        now = time.monotonic()
+        self._invalid_cache = {
+            key: rejected_at for key, rejected_at in self._invalid_cache.items()
+            if now - rejected_at < self.INVALID_TOKEN_TTL
+        }
+        self._invalid_cache[token_key] = now
+    
     # Backward compatibility methods from legacy TokenManager
     def get_api_token(self) -> str:
         """
@@ -804,6 +847,24 @@ class SecureTokenManager:
             
         return token, user_info
     
+    async def a_get_validated_token(self) -> Tuple[str, dict]:
+        """
+        Async variant of get_validated_token for callers running an event loop.
+        
+        Validation (including retry back-off) runs in the default executor so
+        the event loop is never blocked.
+        
+        Returns:
+            Tuple[str, dict]: (token, user_info) if valid
+            
+        Raises:
+            ValueError: If token cannot be obtained or validated
+        """
+        import asyncio
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.get_validated_token)
+    
     def get_validated_token_with_status(self) -> Tuple[str, dict, bool]:
         """
         Get and validate API token, returning token, user info, and config save status.
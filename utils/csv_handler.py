@@ -3,6 +3,7 @@ CSV processing utilities for CDP Runbooker.
 """
 
 import csv
+import io
 import re
 import os
 from typing import List, Dict, Tuple
@@ -32,6 +33,19 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Email pattern compiled against bytes so plain email lists never need decoding
+_EMAIL_RE_B = re.compile(rb'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# Universal line ending (\r\n, bare \r or \n), matching what text mode splits on
+_LINE_END_RE_B = re.compile(rb'\r\n?|\n')
+
+
+def _split_first_line(raw: bytes) -> Tuple[bytes, bytes]:
+    """Split raw bytes into the first line (without its ending) and the remainder."""
+    match = _LINE_END_RE_B.search(raw)
+    if match is None:
+        return raw, b''
+    return raw[:match.start()], raw[match.end():]
+
 
 class CSVProcessor:
     """Handles CSV file processing and email extraction."""
@@ -55,41 +69,38 @@ class CSVProcessor:
                 logger.error(f" CSV file not found: {csv_file_path}")
                 return []
             
+            with open(csv_file_path, 'rb') as csv_file:
+                raw = csv_file.read()
+            
             # Check for Excel-style sep= directive
             delimiter = ','
-            with open(csv_file_path, 'r', encoding='utf-8', errors='ignore') as check_file:
-                first_line = check_file.readline().strip()
-                if 'sep=' in first_line:
-                    delimiter = first_line[first_line.index('sep=') + 4:first_line.index('sep=') + 5]
+            first_bytes, rest = _split_first_line(raw)
+            # Line ending is already stripped, so a tab delimiter survives
+            first_line = first_bytes.decode('utf-8', 'ignore')
+            sep_index = first_line.find('sep=')
+            if sep_index >= 0:
+                if sep_index + 4 < len(first_line) and first_line[sep_index + 4] in ',;\t|':
+                    delimiter = first_line[sep_index + 4]
                     if debug_mode:
                         logger.debug(f" Detected delimiter: '{delimiter}'")
+                elif debug_mode:
+                    logger.debug(f" Ignoring malformed separator directive: '{first_line}'")
+                # Skip Excel separator directive
+                raw = rest
             
-            with open(csv_file_path, 'r', encoding='utf-8', errors='ignore') as csv_file:
-                # Skip Excel separator directive if present
-                if 'sep=' in csv_file.readline():
-                    pass  # Line already consumed
-                else:
-                    csv_file.seek(0)  # Reset if no directive
-                
-                # Try to detect if it's a simple email list
-                first_line = csv_file.readline().strip()
-                is_email_list = '@' in first_line and ',' in first_line and \
-                               not any(header in first_line.lower() for header in ['email', 'name', 'login', 'user'])
-                
-                csv_file.seek(0)
-                if 'sep=' in csv_file.readline():
-                    pass  # Skip directive again
-                else:
-                    csv_file.seek(0)
-                
-                if is_email_list:
-                    # Handle simple comma-separated email list
-                    content = csv_file.read()
-                    found_emails = re.findall(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}', content)
-                    emails = [email.strip() for email in found_emails if email.strip()]
-                else:
-                    # Handle structured CSV
-                    emails = CSVProcessor._extract_from_structured_csv(csv_file, delimiter, debug_mode)
+            # Try to detect if it's a simple email list
+            first_line = _split_first_line(raw)[0].decode('utf-8', 'ignore').strip()
+            is_email_list = '@' in first_line and ',' in first_line and \
+                           not any(header in first_line.lower() for header in ['email', 'name', 'login', 'user'])
+            
+            if is_email_list:
+                # Handle simple comma-separated email list
+                found_emails = _EMAIL_RE_B.findall(raw)
+                emails = [email.decode('ascii').strip() for email in found_emails if email.strip()]
+            else:
+                # Handle structured CSV
+                content = io.StringIO(raw.decode('utf-8', 'ignore'), newline=None)
+                emails = CSVProcessor._extract_from_structured_csv(content, delimiter, debug_mode)
         
         except Exception as e:
             logger.error(f" Error extracting emails from CSV: {str(e)}")
@@ -155,15 +166,16 @@ class CSVProcessor:
             file_name = os.path.basename(input_file_path)
             cleaned_file_path = os.path.join(file_dir, f"cleaned_{file_name}")
             
-            with open(input_file_path, 'r', encoding='utf-8', errors='ignore') as in_file:
-                content = in_file.readlines()
+            with open(input_file_path, 'rb') as in_file:
+                raw = in_file.read()
             
             # Remove Excel separator directive if present
-            if content and 'sep=' in content[0]:
-                content = content[1:]
+            first_line, rest = _split_first_line(raw)
+            if b'sep=' in first_line:
+                raw = rest
             
-            with open(cleaned_file_path, 'w', encoding='utf-8', newline='') as out_file:
-                out_file.writelines(content)
+            with open(cleaned_file_path, 'wb') as out_file:
+                out_file.write(raw)
             
             logger.info(f" Created clean CSV file at {cleaned_file_path}")
             return cleaned_file_path
@@ -6,19 +6,45 @@ user environment issues, import problems, and runtime errors.
 """
 
 import os
+import re
 import sys
 import json
-import platform
-import traceback
-import subprocess
+import stat
+import functools
 import importlib
+import importlib.util
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; the project root is one level up from utils/
+_THIS = Path(__file__).resolve()
+_PROJECT_ROOT = _THIS.parent.parent
+
+# Environment variables included (sanitized) in the system info section
+_RELEVANT_ENV_VARS = frozenset([
+    'PATH', 'PYTHONPATH', 'VIRTUAL_ENV', 'CONDA_DEFAULT_ENV',
+    'SHELL', 'TERM', 'LANG', 'LC_ALL'
+])
+
+# Project files checked by collect_file_structure, relative to the project root
+_EXPECTED_FILES = (
+    'cdpRunbooker.py',
+    '__init__.py',
+    'core/__init__.py',
+    'core/secure_token_manager.py',
+    'core/models.py',
+    'utils/__init__.py',
+    'utils/user_interface.py',
+    'utils/validators.py',
+    'utils/csv_handler.py',
+    'requirements.txt',
+    'README.md'
+)
+
 class DebugReporter:
     """
     Generates comprehensive debug reports for troubleshooting.
@@ -30,17 +56,27 @@ class DebugReporter:
         self.session_id = self._generate_session_id()
         self.timestamp = datetime.now(timezone.utc)
         
+        # (exception, formatted traceback) shared by the import analysis and
+        # error details sections so deep tracebacks are only formatted once
+        self._formatted_tb: Optional[Tuple[BaseException, str]] = None
+        
     def _generate_session_id(self) -> str:
         """Generate a unique session ID for this debug session."""
-        import hashlib
-        import time
-        
-        # Create a unique identifier based on timestamp and process info
-        identifier = f"{time.time()}-{os.getpid()}-{platform.node()}"
-        return hashlib.md5(identifier.encode()).hexdigest()[:8]
+        return os.urandom(4).hex()
+    
+    def _format_traceback(self, error: BaseException) -> str:
+        """Format an exception's traceback, reusing the result for the same exception."""
+        if self._formatted_tb is None or self._formatted_tb[0] is not error:
+            import traceback
+            formatted = ''.join(traceback.TracebackException.from_exception(error).format())
+            self._formatted_tb = (error, formatted)
+        return self._formatted_tb[1]
     
     def collect_system_info(self) -> Dict[str, Any]:
         """Collect comprehensive system information."""
+        import platform
+        
+        home_str = str(Path.home())
         info = {
             'timestamp': self.timestamp.isoformat(),
             'session_id': self.session_id,
@@ -57,40 +93,38 @@ class DebugReporter:
                 'version_info': list(sys.version_info),
                 'executable': sys.executable,
                 'prefix': sys.prefix,
-                'path': sys.path.copy()
+                'path': sys.path
             },
             'environment': {
                 'shell': os.environ.get('SHELL', 'unknown'),
                 'user': os.environ.get('USER', 'unknown'),
-                'home': str(Path.home()),
+                'home': home_str,
                 'cwd': os.getcwd(),
                 'cdp_debug': os.environ.get('CDP_DEBUG', 'not set')
             }
         }
         
         # Add relevant environment variables (sanitized)
-        relevant_env_vars = [
-            'PATH', 'PYTHONPATH', 'VIRTUAL_ENV', 'CONDA_DEFAULT_ENV',
-            'SHELL', 'TERM', 'LANG', 'LC_ALL'
-        ]
+        environ = os.environ
+        variables = {var: environ[var] for var in sorted(_RELEVANT_ENV_VARS.intersection(environ)) if environ[var]}
+        
+        # Sanitize paths that might contain sensitive info: replace a leading
+        # home directory with ~ in each path component
+        home_re = re.compile('^' + re.escape(home_str) + r'(?=[\\/]|$)')
+        for var in ('PATH', 'PYTHONPATH'):
+            if var in variables:
+                variables[var] = os.pathsep.join(
+                    home_re.sub('~', part) for part in variables[var].split(os.pathsep)
+                )
         
-        info['environment']['variables'] = {}
-        for var in relevant_env_vars:
-            value = os.environ.get(var)
-            if value:
-                # Sanitize paths that might contain sensitive info
-                if var in ['PATH', 'PYTHONPATH']:
-                    # Replace home directory with ~
-                    home_str = str(Path.home())
-                    value = value.replace(home_str, '~')
-                info['environment']['variables'][var] = value
+        info['environment']['variables'] = variables
         
         return info
     
     def collect_execution_context(self) -> Dict[str, Any]:
         """Collect information about how the script is being executed."""
         context = {
-            'command_line': sys.argv.copy(),
+            'command_line': sys.argv,
             'script_path': None,
             'execution_method': 'unknown',
             'main_module': None,
@@ -129,45 +163,50 @@ class DebugReporter:
         }
         
         # Try to find project root
-        current_file = Path(__file__).resolve()
-        project_root = current_file.parent.parent  # Go up from utils/
+        project_root = _PROJECT_ROOT
         
         if project_root.name == 'CDP-Quip-Runbooker':
             structure['project_root'] = str(project_root)
             
             # Check for expected files
-            expected_files = [
-                'cdpRunbooker.py',
-                '__init__.py',
-                'core/__init__.py',
-                'core/secure_token_manager.py',
-                'core/models.py',
-                'utils/__init__.py',
-                'utils/user_interface.py',
-                'utils/validators.py',
-                'utils/csv_handler.py',
-                'requirements.txt',
-                'README.md'
-            ]
-            
-            for file_path in expected_files:
+            files_found, files_missing = structure['files_found'], structure['files_missing']
+            for file_path in _EXPECTED_FILES:
                 full_path = project_root / file_path
-                if full_path.exists():
-                    structure['files_found'][file_path] = {
-                        'exists': True,
-                        'size': full_path.stat().st_size,
-                        'readable': os.access(full_path, os.R_OK),
-                        'writable': os.access(full_path, os.W_OK)
-                    }
-                else:
-                    structure['files_missing'][file_path] = 'File not found'
+                try:
+                    st = os.stat(full_path)
+                except OSError:
+                    files_missing[file_path] = 'File not found'
+                    continue
+                
+                readable, writable = self._file_access(full_path, st)
+                files_found[file_path] = {
+                    'exists': True,
+                    'size': st.st_size,
+                    'readable': readable,
+                    'writable': writable
+                }
         
         return structure
     
+    @staticmethod
+    def _file_access(path: Path, st: os.stat_result) -> Tuple[bool, bool]:
+        """
+        Determine (readable, writable) for the current user from a stat result.
+        
+        Owner permission bits answer this directly for files we own; other
+        cases (group/ACLs, root, Windows) fall back to os.access.
+        """
+        geteuid = getattr(os, 'geteuid', None)
+        if geteuid is not None:
+            euid = geteuid()
+            if euid != 0 and st.st_uid == euid:
+                return bool(st.st_mode & stat.S_IRUSR), bool(st.st_mode & stat.S_IWUSR)
+        return os.access(path, os.R_OK), os.access(path, os.W_OK)
+    
     def collect_import_analysis(self, error_context: Optional[Exception] = None) -> Dict[str, Any]:
         """Collect detailed import analysis and attempt resolution."""
         analysis = {
-            'python_path': sys.path.copy(),
+            'python_path': sys.path,
             'import_attempts': [],
             'module_discovery': {},
             'error_context': None
@@ -177,7 +216,7 @@ class DebugReporter:
             analysis['error_context'] = {
                 'type': type(error_context).__name__,
                 'message': str(error_context),
-                'traceback': ''.join(traceback.format_exception(type(error_context), error_context, error_context.__traceback__))
+                'traceback': self._format_traceback(error_context)
             }
         
         # Test common import scenarios
@@ -196,12 +235,16 @@ class DebugReporter:
                 'path': None
             }
             
+            # Locate the module without executing it
             try:
-                module = importlib.import_module(module_name)
-                attempt['status'] = 'success'
-                if hasattr(module, '__file__'):
-                    attempt['path'] = module.__file__
-            except ImportError as e:
+                spec = importlib.util.find_spec(module_name)
+                if spec:
+                    attempt['status'] = 'success'
+                    attempt['path'] = getattr(spec, 'origin', None)
+                else:
+                    attempt['status'] = 'failed'
+                    attempt['error'] = f"No module named {module_name!r}"
+            except (ImportError, ValueError) as e:
                 attempt['status'] = 'failed'
                 attempt['error'] = str(e)
             except Exception as e:
@@ -210,15 +253,17 @@ class DebugReporter:
             
             analysis['import_attempts'].append(attempt)
         
-        # Module discovery
+        # Module discovery (names only, so a plain directory scan is enough)
         try:
-            import pkgutil
-            current_path = Path(__file__).parent.parent
-            for importer, modname, ispkg in pkgutil.iter_modules([str(current_path)]):
-                analysis['module_discovery'][modname] = {
-                    'is_package': ispkg,
-                    'importer': str(type(importer))
-                }
+            discovered = analysis['module_discovery']
+            with os.scandir(_PROJECT_ROOT) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    name = entry.name
+                    if entry.is_dir():
+                        if os.path.isfile(os.path.join(entry.path, '__init__.py')):
+                            discovered[name] = {'is_package': True}
+                    elif entry.is_file() and name.endswith('.py') and name != '__init__.py':
+                        discovered[name[:-3]] = {'is_package': False}
         except Exception as e:
             analysis['module_discovery']['error'] = str(e)
         
@@ -229,27 +274,52 @@ class DebugReporter:
         deps = {
             'required_packages': {},
             'optional_packages': {},
-            'pip_list': None
+            'pip_list': [],
+            'pip_list_error': None
         }
         
+        # One sweep over installed *.dist-info metadata answers every package
+        # lookup below without importing (and executing) the packages.
+        # Python 3.7 lacks importlib.metadata; everything then goes through find_spec.
+        try:
+            from importlib.metadata import distributions
+        except ImportError:
+            distributions = None
+        
+        dists = {}
+        dist_error = None
+        if distributions is not None:
+            try:
+                for dist in distributions():
+                    name = dist.metadata['Name']
+                    if name:
+                        dists.setdefault(name.lower().replace('_', '-'), dist)
+            except Exception as e:
+                dist_error = e
+        
         # Check required packages
         required = [
             'requests', 'cryptography', 'pathlib'
         ]
         
         for package in required:
-            try:
-                module = importlib.import_module(package)
-                version = getattr(module, '__version__', 'unknown')
+            dist = dists.get(package.lower().replace('_', '-'))
+            if dist is not None:
+                deps['required_packages'][package] = self._describe_distribution(dist)
+                continue
+            
+            spec, error = self._find_module_spec(package)
+            if spec is not None:
+                # Not an installed distribution (e.g. stdlib modules like pathlib)
                 deps['required_packages'][package] = {
                     'status': 'available',
-                    'version': version,
-                    'path': getattr(module, '__file__', 'unknown')
+                    'version': 'unknown',
+                    'path': spec.origin or 'unknown'
                 }
-            except ImportError as e:
+            else:
                 deps['required_packages'][package] = {
                     'status': 'missing',
-                    'error': str(e)
+                    'error': error
                 }
         
         # Check optional packages
@@ -258,29 +328,61 @@ class DebugReporter:
         ]
         
         for package in optional:
-            try:
-                module = importlib.import_module(package)
-                version = getattr(module, '__version__', 'unknown')
+            dist = dists.get(package.lower().replace('_', '-'))
+            if dist is not None:
+                deps['optional_packages'][package] = self._describe_distribution(dist)
+            elif self._find_module_spec(package)[0] is not None:
                 deps['optional_packages'][package] = {
                     'status': 'available',
-                    'version': version
+                    'version': 'unknown'
                 }
-            except ImportError:
+            else:
                 deps['optional_packages'][package] = {
                     'status': 'not_available'
                 }
         
-        # Try to get pip list
+        # Installed distributions as sorted (name, version) pairs, reusing the
+        # metadata sweep above. CDP_DEBUG_PIPLIST=1 (or Python 3.7) falls back
+        # to the slower `pip list` subprocess. Failures go to pip_list_error.
         try:
-            result = subprocess.run([sys.executable, '-m', 'pip', 'list'], 
-                                  capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                deps['pip_list'] = result.stdout
+            if distributions is None or os.environ.get('CDP_DEBUG_PIPLIST'):
+                import subprocess
+                result = subprocess.run([sys.executable, '-m', 'pip', 'list', '--format=json'], 
+                                      capture_output=True, text=True, timeout=10)
+                if result.returncode == 0:
+                    packages = [(pkg['name'], pkg['version']) for pkg in json.loads(result.stdout)]
+                else:
+                    raise RuntimeError(result.stderr.strip() or f"pip exited with code {result.returncode}")
+            elif dist_error is not None:
+                raise dist_error
+            else:
+                packages = [(dist.metadata['Name'], dist.version) for dist in dists.values()]
+            deps['pip_list'] = sorted(packages, key=lambda item: item[0].lower())
         except Exception as e:
-            deps['pip_list'] = f"Error getting pip list: {str(e)}"
+            deps['pip_list_error'] = f"Error getting pip list: {str(e)}"
         
         return deps
     
+    @staticmethod
+    def _describe_distribution(dist: Any) -> Dict[str, Any]:
+        """Describe an installed package from its distribution metadata alone."""
+        return {
+            'status': 'available',
+            'version': dist.version,
+            'path': str(dist.locate_file(''))
+        }
+    
+    @staticmethod
+    def _find_module_spec(module_name: str) -> Tuple[Optional[Any], Optional[str]]:
+        """Locate a module without importing it, returning (spec, error_message)."""
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError) as e:
+            return None, str(e)
+        if spec is None:
+            return None, f"No module named {module_name!r}"
+        return spec, None
+    
     def collect_error_details(self, error: Optional[Exception] = None) -> Dict[str, Any]:
         """Collect detailed error information."""
         if not error:
@@ -300,7 +402,7 @@ class DebugReporter:
         return {
             'type': type(error).__name__,
             'message': str(error),
-            'traceback': ''.join(traceback.format_exception(type(error), error, error.__traceback__)),
+            'traceback': self._format_traceback(error),
             'context': {
                 'file': context_file,
                 'line': context_line
@@ -345,7 +447,12 @@ class DebugReporter:
     
     def generate_full_report(self, error: Optional[Exception] = None, 
                            include_error_context: bool = True) -> Dict[str, Any]:
-        """Generate a comprehensive debug report."""
+        """
+        Generate a comprehensive debug report.
+        
+        sys.path and sys.argv are referenced rather than copied, so the report
+        should be formatted or saved before either is modified.
+        """
         report = {
             'metadata': {
                 'generated_at': self.timestamp.isoformat(),
@@ -355,37 +462,25 @@ class DebugReporter:
             }
         }
         
-        # Collect all diagnostic information
-        try:
-            report['system_info'] = self.collect_system_info()
-        except Exception as e:
-            report['system_info'] = {'error': str(e)}
-        
-        try:
-            report['execution_context'] = self.collect_execution_context()
-        except Exception as e:
-            report['execution_context'] = {'error': str(e)}
-        
-        try:
-            report['file_structure'] = self.collect_file_structure()
-        except Exception as e:
-            report['file_structure'] = {'error': str(e)}
-        
-        try:
-            report['import_analysis'] = self.collect_import_analysis(error if include_error_context else None)
-        except Exception as e:
-            report['import_analysis'] = {'error': str(e)}
-        
-        try:
-            report['dependencies'] = self.collect_dependency_info()
-        except Exception as e:
-            report['dependencies'] = {'error': str(e)}
-        
+        # Collect all diagnostic information; a failing collector only
+        # records its error and never aborts the report
+        collectors = [
+            ('system_info', self.collect_system_info),
+            ('execution_context', self.collect_execution_context),
+            ('file_structure', self.collect_file_structure),
+            ('import_analysis', functools.partial(
+                self.collect_import_analysis, error if include_error_context else None
+            )),
+            ('dependencies', self.collect_dependency_info),
+        ]
         if error:
+            collectors.append(('error_details', functools.partial(self.collect_error_details, error)))
+        
+        for key, collect in collectors:
             try:
-                report['error_details'] = self.collect_error_details(error)
+                report[key] = collect()
             except Exception as e:
-                report['error_details'] = {'error': str(e)}
+                report[key] = {'error': str(e)}
         
         # Generate recommendations
         try:
@@ -395,149 +490,194 @@ class DebugReporter:
         
         return report
     
-    def format_report_as_markdown(self, report_data: Dict[str, Any]) -> str:
-        """Format the debug report as a readable markdown document."""
-        md_lines = []
+    def iter_report_lines(self, report_data: Dict[str, Any]) -> Iterator[str]:
+        """
+        Yield the markdown debug report in newline-terminated chunks.
         
+        Lets callers stream the report to disk without holding the whole
+        document in memory.
+        """
         # Header
-        md_lines.extend([
-            "# CDP-Runbooker Debug Report",
-            "",
-            f"**Generated:** {report_data['metadata']['generated_at']}  ",
-            f"**Session ID:** {report_data['metadata']['session_id']}  ",
-            f"**CDP-Runbooker Version:** {report_data['metadata']['cdp_runbooker_version']}  ",
-            "",
-            "---",
-            ""
-        ])
+        metadata = report_data['metadata']
+        yield (
+            "# CDP-Runbooker Debug Report\n"
+            "\n"
+            f"**Generated:** {metadata['generated_at']}  \n"
+            f"**Session ID:** {metadata['session_id']}  \n"
+            f"**CDP-Runbooker Version:** {metadata['cdp_runbooker_version']}  \n"
+            "\n"
+            "---\n"
+            "\n"
+        )
         
         # System Information
         if 'system_info' in report_data:
-            md_lines.extend([
-                "## System Information",
-                "",
-                f"- **OS:** {report_data['system_info'].get('platform', {}).get('system', 'unknown')} {report_data['system_info'].get('platform', {}).get('release', '')}",
-                f"- **Python:** {report_data['system_info'].get('python', {}).get('version', 'unknown').split()[0]} ({report_data['system_info'].get('python', {}).get('executable', 'unknown')})",
-                f"- **Shell:** {report_data['system_info'].get('environment', {}).get('shell', 'unknown')}",
-                f"- **Working Directory:** {report_data['system_info'].get('environment', {}).get('cwd', 'unknown')}",
-                ""
-            ])
+            system_info = report_data['system_info']
+            platform_info = system_info.get('platform', {})
+            python_info = system_info.get('python', {})
+            environment = system_info.get('environment', {})
+            yield (
+                "## System Information\n"
+                "\n"
+                f"- **OS:** {platform_info.get('system', 'unknown')} {platform_info.get('release', '')}\n"
+                f"- **Python:** {python_info.get('version', 'unknown').split()[0]} ({python_info.get('executable', 'unknown')})\n"
+                f"- **Shell:** {environment.get('shell', 'unknown')}\n"
+                f"- **Working Directory:** {environment.get('cwd', 'unknown')}\n"
+                "\n"
+            )
         
         # Execution Context
         if 'execution_context' in report_data:
-            md_lines.extend([
-                "## Execution Context",
-                "",
-                f"- **Script Path:** {report_data['execution_context'].get('script_path', 'unknown')}",
-                f"- **Execution Method:** {report_data['execution_context'].get('execution_method', 'unknown')}",
-                f"- **Command Line:** `{' '.join(report_data['execution_context'].get('command_line', []))}`",
-                ""
-            ])
+            context = report_data['execution_context']
+            yield (
+                "## Execution Context\n"
+                "\n"
+                f"- **Script Path:** {context.get('script_path', 'unknown')}\n"
+                f"- **Execution Method:** {context.get('execution_method', 'unknown')}\n"
+                f"- **Command Line:** `{' '.join(context.get('command_line', []))}`\n"
+                "\n"
+            )
         
         # Import Analysis
         if 'import_analysis' in report_data:
-            md_lines.extend([
-                "## Import Analysis",
-                "",
-                "### Import Attempts",
-                ""
-            ])
+            yield (
+                "## Import Analysis\n"
+                "\n"
+                "### Import Attempts\n"
+                "\n"
+            )
             
             for attempt in report_data['import_analysis'].get('import_attempts', []):
                 status_emoji = "✅" if attempt['status'] == 'success' else "❌"
-                md_lines.append(f"{status_emoji} **{attempt['module']}** - {attempt['description']}")
+                yield f"{status_emoji} **{attempt['module']}** - {attempt['description']}\n"
                 if attempt['status'] != 'success':
-                    md_lines.append(f"   - Error: {attempt.get('error', 'unknown')}")
+                    yield f"   - Error: {attempt.get('error', 'unknown')}\n"
                 elif attempt.get('path'):
-                    md_lines.append(f"   - Path: {attempt['path']}")
-                md_lines.append("")
+                    yield f"   - Path: {attempt['path']}\n"
+                yield "\n"
         
         # File Structure
         if 'file_structure' in report_data:
-            md_lines.extend([
-                "## File Structure Validation",
-                ""
-            ])
+            file_structure = report_data['file_structure']
+            yield "## File Structure Validation\n\n"
             
-            for file_path, info in report_data['file_structure'].get('files_found', {}).items():
-                md_lines.append(f"✅ {file_path}")
+            for file_path in file_structure.get('files_found', {}):
+                yield f"✅ {file_path}\n"
             
-            for file_path, error in report_data['file_structure'].get('files_missing', {}).items():
-                md_lines.append(f"❌ {file_path} - {error}")
+            for file_path, error in file_structure.get('files_missing', {}).items():
+                yield f"❌ {file_path} - {error}\n"
             
-            md_lines.append("")
+            yield "\n"
         
         # Dependencies
         if 'dependencies' in report_data:
-            md_lines.extend([
-                "## Dependencies",
-                ""
-            ])
+            yield "## Dependencies\n\n"
             
             for pkg, info in report_data['dependencies'].get('required_packages', {}).items():
                 status_emoji = "✅" if info['status'] == 'available' else "❌"
                 version = f" (version {info.get('version', 'unknown')})" if info.get('version') != 'unknown' else ""
-                md_lines.append(f"{status_emoji} **{pkg}**{version}")
+                yield f"{status_emoji} **{pkg}**{version}\n"
                 if info['status'] != 'available':
-                    md_lines.append(f"   - Error: {info.get('error', 'not available')}")
+                    yield f"   - Error: {info.get('error', 'not available')}\n"
             
-            md_lines.append("")
+            yield "\n"
         
         # Error Details
         if 'error_details' in report_data:
-            md_lines.extend([
-                "## Error Details",
-                "",
-                f"**Type:** {report_data['error_details']['type']}  ",
-                f"**Message:** {report_data['error_details']['message']}  ",
-                "",
-                "**Traceback:**",
-                "```",
-                report_data['error_details']['traceback'],
-                "```",
-                ""
-            ])
+            error_details = report_data['error_details']
+            yield (
+                "## Error Details\n"
+                "\n"
+                f"**Type:** {error_details['type']}  \n"
+                f"**Message:** {error_details['message']}  \n"
+                "\n"
+                "**Traceback:**\n"
+                "```\n"
+                f"{error_details['traceback']}\n"
+                "```\n"
+                "\n"
+            )
         
         # Recommendations
         if 'recommendations' in report_data:
-            md_lines.extend([
-                "## Recommendations",
-                ""
-            ])
+            yield "## Recommendations\n\n"
             
             for i, rec in enumerate(report_data['recommendations'], 1):
-                md_lines.append(f"{i}. {rec}")
+                yield f"{i}. {rec}\n"
             
-            md_lines.append("")
+            yield "\n"
         
         # Footer
-        md_lines.extend([
-            "---",
-            "",
-            "**Note:** This report contains diagnostic information to help troubleshoot CDP-Runbooker issues.",
-            "Personal information has been sanitized, but please review before sharing.",
-            ""
-        ])
-        
-        return "\n".join(md_lines)
+        yield (
+            "---\n"
+            "\n"
+            "**Note:** This report contains diagnostic information to help troubleshoot CDP-Runbooker issues.\n"
+            "Personal information has been sanitized, but please review before sharing.\n"
+        )
+    
+    def format_report_as_markdown(self, report_data: Dict[str, Any]) -> str:
+        """Format the debug report as a readable markdown document."""
+        return "".join(self.iter_report_lines(report_data))
     
     def save_report(self, report_data: Dict[str, Any], output_dir: Optional[str] = None) -> str:
         """Save the debug report to a file."""
-        if output_dir is None:
-            output_dir = os.getcwd()
+        filepath = self._report_path(output_dir, '.md')
         
-        # Generate filename
-        timestamp_str = self.timestamp.strftime("%Y%m%d_%H%M%S")
-        filename = f"cdp-runbooker-debug-{timestamp_str}-{self.session_id}.md"
-        filepath = Path(output_dir) / filename
+        # Stream the formatted report straight to disk
+        self._write_atomically(
+            filepath,
+            lambda f: f.writelines(self.iter_report_lines(report_data)),
+            mode='w', encoding='utf-8', buffering=65536, newline='\n'
+        )
         
-        # Format and save
-        markdown_content = self.format_report_as_markdown(report_data)
+        return str(filepath)
+    
+    def save_report_json(self, report_data: Dict[str, Any], output_dir: Optional[str] = None) -> str:
+        """
+        Save the raw debug report as JSON for programmatic consumers.
+        
+        Skips markdown rendering entirely. Uses orjson when installed and
+        falls back to the standard library json module.
+        """
+        filepath = self._report_path(output_dir, '.json')
+        
+        try:
+            import orjson
+            payload = orjson.dumps(report_data, default=str)
+        except ImportError:
+            payload = json.dumps(report_data, ensure_ascii=False, separators=(',', ':'),
+                                 default=str).encode('utf-8')
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
+        self._write_atomically(filepath, lambda f: f.write(payload), mode='wb')
         
         return str(filepath)
+    
+    def _report_path(self, output_dir: Optional[str], extension: str) -> Path:
+        """Build the report file path for this session."""
+        if output_dir is None:
+            output_dir = os.getcwd()
+        
+        timestamp_str = self.timestamp.strftime("%Y%m%d_%H%M%S")
+        filename = f"cdp-runbooker-debug-{timestamp_str}-{self.session_id}{extension}"
+        return Path(output_dir) / filename
+    
+    @staticmethod
+    def _write_atomically(filepath: Path, write: Callable[[IO], Any], **open_kwargs) -> None:
+        """
+        Write a file via a temp file and rename, so a crash never leaves a
+        truncated report behind.
+        """
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        try:
+            with open(tmp_path, **open_kwargs) as f:
+                write(f)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
 
 
 def generate_debug_report(error: Optional[Exception] = None, 
@@ -7,64 +7,107 @@ and provides helpful guidance when they're missing.
 """
 
 import os
+import re
 import sys
 import subprocess
+import functools
+import importlib.util
 from typing import List, Tuple, Optional
 
+# Package root directory (one level up from utils/), computed once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Leading distribution name of a requirement line (stops at version specifiers, extras, markers)
+_REQ_RE = re.compile(r'\s*([A-Za-z0-9_.\-]+)')
+
+# Used when requirements.txt is missing or unreadable
+_FALLBACK_REQUIREMENTS = ('quipclient', 'requests', 'urllib3', 'cryptography', 'certifi')
+
 
 def get_requirements_list(requirements_file: str = "requirements.txt") -> List[str]:
     """
     Parse requirements.txt and return list of required packages.
     
+    Parsed results are cached per file and modification time, so repeated
+    calls only cost a stat until the file changes.
+    
     Args:
         requirements_file: Path to requirements.txt file
         
     Returns:
         List of package names (without version constraints)
     """
-    requirements = []
-    
     # Find requirements.txt relative to this script
-    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    requirements_path = os.path.join(script_dir, requirements_file)
+    requirements_path = os.path.join(_PROJECT_ROOT, requirements_file)
     
-    if not os.path.exists(requirements_path):
+    try:
+        mtime_ns = os.stat(requirements_path).st_mtime_ns
+    except OSError:
         # Fallback requirements if file not found
-        return ['quipclient', 'requests', 'urllib3', 'cryptography', 'certifi']
+        return list(_FALLBACK_REQUIREMENTS)
+    
+    return list(_parse_requirements(requirements_path, mtime_ns))
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_requirements(requirements_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    """
+    Parse package names from a requirements file.
+    
+    mtime_ns is only part of the cache key so edits to the file are picked up.
+    """
+    requirements = []
     
     try:
         with open(requirements_path, 'r', encoding='utf-8') as f:
             for line in f:
-                line = line.strip()
-                if line and not line.startswith('#'):
-                    # Extract package name (remove version constraints)
-                    package = line.split('>=')[0].split('==')[0].split('~=')[0].split('>')[0].split('<')[0].strip()
-                    if package:
-                        requirements.append(package)
+                if line.lstrip().startswith('#'):
+                    continue
+                match = _REQ_RE.match(line)
+                if match:
+                    requirements.append(match.group(1))
     except Exception:
         # Fallback requirements if parsing fails
-        return ['quipclient', 'requests', 'urllib3', 'cryptography', 'certifi']
+        return _FALLBACK_REQUIREMENTS
     
-    return requirements
+    return tuple(requirements)
 
 
-def check_dependency(package_name: str) -> Tuple[bool, Optional[str]]:
+def check_dependency(package_name: str, deep_check: bool = False) -> Tuple[bool, Optional[str]]:
     """
     Check if a specific dependency is available.
     
+    By default only the import spec is looked up, so the package's module
+    code is never executed. Pass deep_check=True to actually import it
+    (e.g. when module attributes such as __version__ are needed).
+    
     Args:
         package_name: Name of the package to check
+        deep_check: Import the package instead of only locating it
         
     Returns:
         Tuple of (is_available, error_message)
     """
+    if deep_check:
+        try:
+            __import__(package_name)
+            return True, None
+        except ImportError as e:
+            return False, str(e)
+        except Exception as e:
+            return False, f"Unexpected error importing {package_name}: {str(e)}"
+    
     try:
-        __import__(package_name)
-        return True, None
-    except ImportError as e:
+        spec = importlib.util.find_spec(package_name)
+    except (ImportError, ValueError) as e:
+        # Raised for dotted names whose parent package is missing or malformed
         return False, str(e)
     except Exception as e:
-        return False, f"Unexpected error importing {package_name}: {str(e)}"
+        return False, f"Unexpected error locating {package_name}: {str(e)}"
+    
+    if spec is None:
+        return False, f"No module named {package_name!r}"
+    return True, None
 
 
 def validate_all_dependencies() -> Tuple[bool, List[str], List[str]]:
@@ -96,7 +139,7 @@ def get_install_path() -> str:
         String with installation command path
     """
     # Try to find the package root directory
-    script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script_dir = _PROJECT_ROOT
     
     # Check if we're in a git repository
     if os.path.exists(os.path.join(script_dir, '.git')):
@@ -159,26 +202,24 @@ def check_installation_currency() -> None:
     Provides a warning but doesn't exit.
     """
     try:
-        script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script_dir = _PROJECT_ROOT
         requirements_path = os.path.join(script_dir, 'requirements.txt')
         
         if not os.path.exists(requirements_path):
             return  # Can't check without requirements file
         
         # Get modification time of requirements.txt
-        import stat
-        req_mtime = os.stat(requirements_path)[stat.ST_MTIME]
+        req_mtime = int(os.stat(requirements_path).st_mtime)
         
         # Try to find when the package was installed by checking __pycache__
         pycache_dir = os.path.join(script_dir, '__pycache__')
         if os.path.exists(pycache_dir):
-            # Get the newest file in __pycache__
-            newest_cache = 0
-            for filename in os.listdir(pycache_dir):
-                filepath = os.path.join(pycache_dir, filename)
-                if os.path.isfile(filepath):
-                    file_mtime = os.stat(filepath)[stat.ST_MTIME]
-                    newest_cache = max(newest_cache, file_mtime)
+            # Get the newest file in __pycache__ (DirEntry caches file type and stat info)
+            with os.scandir(pycache_dir) as entries:
+                newest_cache = max(
+                    (int(entry.stat().st_mtime) for entry in entries if entry.is_file()),
+                    default=0
+                )
             
             # If requirements.txt is newer than the cache, warn user
             if req_mtime > newest_cache:
@@ -10,13 +10,59 @@ This module provides utilities to handle imports across different execution cont
 
 import os
 import sys
+import functools
 import importlib
+import importlib.util
 import logging
 from pathlib import Path
-from typing import Any, Optional, List, Dict
+from typing import Any, Optional, List, Dict, Set
 
 logger = logging.getLogger(__name__)
 
+# Filesystem layout, resolved once at import instead of on every call
+_CURRENT_FILE = Path(__file__).resolve()
+_UTILS_DIR = _CURRENT_FILE.parent
+_PROJECT_ROOT = _UTILS_DIR.parent  # Go up from utils/ to project root
+_CORE_DIR = _PROJECT_ROOT / 'core'
+_CORE_DIR_EXISTS = _CORE_DIR.is_dir()
+
+# Import path for user_interface matching how this module was loaded: relative
+# when nested inside a parent package, absolute otherwise
+_PREFERRED_IMPORT_PATH = (
+    '..utils.user_interface' if __package__ and '.' in __package__ else 'utils.user_interface'
+)
+
+# user_interface module once resolved by safe_import_user_interface
+_UI_MODULE = None
+
+# Module paths that failed a plain import, valid only for the sys.path they
+# failed under (_MISSING_SYS_PATH); any change to sys.path invalidates them.
+# The snapshot is taken when the first entry is added and only compared while
+# the set is non-empty, so the common no-failure path never copies sys.path.
+_MISSING: Set[str] = set()
+_MISSING_SYS_PATH: Optional[tuple] = None
+
+# Relative module path -> absolute module name (None if it cannot be resolved here)
+_RESOLVED_NAMES: Dict[str, Optional[str]] = {}
+
+
+def _absolute_module_name(module_path: str) -> Optional[str]:
+    """Resolve a (possibly relative) module path against this package, caching the result."""
+    if not module_path.startswith('.'):
+        return module_path
+    try:
+        return _RESOLVED_NAMES[module_path]
+    except KeyError:
+        pass
+    try:
+        name = importlib.util.resolve_name(module_path, __package__)
+    except (ImportError, ValueError):
+        # Relative import beyond the top-level package (or no package context)
+        name = None
+    _RESOLVED_NAMES[module_path] = name
+    return name
+
+
 class ImportResolver:
     """
     Handles robust import resolution across different execution contexts.
@@ -37,10 +83,31 @@ class ImportResolver:
         Raises:
             ImportError: If all import attempts fail
         """
+        global _MISSING_SYS_PATH
         import_errors = []
+        modules = sys.modules
+        
+        # Forget cached failures if sys.path changed since they were recorded
+        if _MISSING and tuple(sys.path) != _MISSING_SYS_PATH:
+            _MISSING.clear()
         
         # Strategy 1: Try each module path as-is
         for module_path in module_paths:
+            # Fast path: already imported, skip the import machinery entirely
+            absolute_name = _absolute_module_name(module_path)
+            if absolute_name is None:
+                # Relative path with no enclosing package to resolve against
+                import_errors.append(f"{module_path}: no parent package for relative import")
+                continue
+            module = modules.get(absolute_name)
+            if module is not None:
+                return module
+            
+            # Skip paths already known to be missing from the current sys.path
+            if module_path in _MISSING:
+                import_errors.append(f"{module_path}: not found (cached)")
+                continue
+            
             try:
                 if module_path.startswith('.'):
                     # Relative import
@@ -50,16 +117,27 @@ class ImportResolver:
                     module = importlib.import_module(module_path)
                 return module
             except ImportError as e:
+                # Only remember genuinely missing modules, not errors raised while
+                # executing a module that does exist
+                missing_name = getattr(e, 'name', None)
+                if missing_name and (absolute_name + '.').startswith(missing_name + '.'):
+                    if not _MISSING:
+                        _MISSING_SYS_PATH = tuple(sys.path)
+                    _MISSING.add(module_path)
                 import_errors.append(f"{module_path}: {str(e)}")
                 continue
         
         # Strategy 2: Try with path manipulation
         if fallback_paths:
-            original_path = sys.path.copy()
+            # Track only the entries we add so they can be removed afterwards
+            added = []
             try:
+                path_set = set(sys.path)
                 for path in fallback_paths:
-                    if path not in sys.path:
+                    if path not in path_set:
                         sys.path.insert(0, path)
+                        path_set.add(path)
+                        added.append(path)
                 
                 for module_path in module_paths:
                     try:
@@ -71,14 +149,18 @@ class ImportResolver:
                         import_errors.append(f"{module_path} (with path): {str(e)}")
                         continue
             finally:
-                sys.path = original_path
+                for path in added:
+                    try:
+                        sys.path.remove(path)
+                    except ValueError:
+                        pass
         
         # Strategy 3: Try to construct path based on current file location
-        current_file = Path(__file__).resolve()
-        project_root = current_file.parent.parent  # Go up from utils/ to project root
+        # (skipped when Strategy 2 already tried with the project root on sys.path)
+        project_root = str(_PROJECT_ROOT)
         
-        if str(project_root) not in sys.path:
-            sys.path.insert(0, str(project_root))
+        if not (fallback_paths and project_root in fallback_paths) and project_root not in sys.path:
+            sys.path.insert(0, project_root)
             
             for module_path in module_paths:
                 try:
@@ -106,7 +188,6 @@ class ImportResolver:
             'script_path': None,
             'package_name': None,
             'is_main': False,
-            'python_path': sys.path.copy(),
             'working_directory': os.getcwd()
         }
         
@@ -132,6 +213,18 @@ class ImportResolver:
         
         return context
     
+    @staticmethod
+    def get_python_path() -> List[str]:
+        """
+        Snapshot the current sys.path.
+        
+        Kept out of get_execution_context so the copy is only made when needed.
+        
+        Returns:
+            Copy of sys.path
+        """
+        return sys.path.copy()
+    
     @staticmethod
     def setup_import_paths() -> List[str]:
         """
@@ -141,25 +234,23 @@ class ImportResolver:
             List of paths that were added to sys.path
         """
         added_paths = []
-        current_file = Path(__file__).resolve()
-        
-        # Add project root (parent of utils directory)
-        project_root = current_file.parent.parent
-        if str(project_root) not in sys.path:
-            sys.path.insert(0, str(project_root))
-            added_paths.append(str(project_root))
-        
-        # Add utils directory itself
-        utils_dir = current_file.parent
-        if str(utils_dir) not in sys.path:
-            sys.path.insert(0, str(utils_dir))
-            added_paths.append(str(utils_dir))
-        
-        # Add core directory
-        core_dir = project_root / 'core'
-        if core_dir.exists() and str(core_dir) not in sys.path:
-            sys.path.insert(0, str(core_dir))
-            added_paths.append(str(core_dir))
+        path_set = set(sys.path)
+        
+        # Project root (parent of utils directory), utils directory itself, core directory
+        candidates = [_PROJECT_ROOT, _UTILS_DIR]
+        if _CORE_DIR_EXISTS:
+            candidates.append(_CORE_DIR)
+        
+        for path in candidates:
+            path_str = str(path)
+            if path_str not in path_set:
+                path_set.add(path_str)
+                added_paths.append(path_str)
+        
+        # Prepend in one slice assignment; reversed so the final order matches
+        # inserting each path at index 0 in turn (core, utils, project root).
+        if added_paths:
+            sys.path[:0] = added_paths[::-1]
         
         return added_paths
 
@@ -174,12 +265,23 @@ def safe_import_user_interface():
     Raises:
         ImportError: If import fails with all strategies
     """
+    global _UI_MODULE
+    if _UI_MODULE is not None:
+        return _UI_MODULE
+    
+    # The path valid for this execution context almost always works on its own
+    try:
+        _UI_MODULE = importlib.import_module(_PREFERRED_IMPORT_PATH, package=__package__)
+        return _UI_MODULE
+    except ImportError:
+        pass
+    
     resolver = ImportResolver()
     
     # Set up paths
     fallback_paths = resolver.setup_import_paths()
     
-    # Try different import paths
+    # Fall back to trying every import path
     module_paths = [
         '..utils.user_interface',  # Relative import (package context)
         'utils.user_interface',    # Absolute import
@@ -188,15 +290,18 @@ def safe_import_user_interface():
     
     try:
         module = resolver.resolve_import(module_paths, fallback_paths)
+        _UI_MODULE = module
         return module
     except ImportError as e:
         # Log the context for debugging
         context = resolver.get_execution_context()
         logger.error(f"Failed to import user_interface. Context: {context}")
+        logger.error(f"Python path: {resolver.get_python_path()}")
         logger.error(f"Import error: {str(e)}")
         raise
 
 
+@functools.lru_cache(maxsize=None)
 def safe_import_from_user_interface(*names):
     """
     Safely import specific items from user_interface module.
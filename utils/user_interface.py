@@ -4,7 +4,6 @@ User interface utilities for CDP Runbooker.
 
 import os
 import sys
-import time
 from enum import Enum
 
 
@@ -46,34 +45,43 @@ class UserMessenger:
         MessageType.STEP: "▶️"
     }
     
+    # (symbol, color) per message type, resolved with a single lookup
+    _STYLE = {
+        MessageType.SUCCESS: (SYMBOLS[MessageType.SUCCESS], 'green'),
+        MessageType.WARNING: (SYMBOLS[MessageType.WARNING], 'yellow'),
+        MessageType.ERROR: (SYMBOLS[MessageType.ERROR], 'red'),
+        MessageType.INFO: (SYMBOLS[MessageType.INFO], 'blue'),
+        MessageType.PROMPT: (SYMBOLS[MessageType.PROMPT], 'cyan'),
+        MessageType.HEADER: (SYMBOLS[MessageType.HEADER], 'magenta'),
+        MessageType.STEP: (SYMBOLS[MessageType.STEP], 'cyan')
+    }
+    
+    # Whether stdout supports color; decided once on first use (see reset_color_cache)
+    _color_enabled = None
+    
     @classmethod
     def _colorize(cls, text: str, color: str) -> str:
         """Apply color formatting to text if terminal supports it."""
-        try:
-            if os.getenv('NO_COLOR') or not os.isatty(sys.stdout.fileno()):
-                return text
-            return f"{cls.COLORS.get(color, '')}{text}{cls.COLORS['reset']}"
-        except (AttributeError, OSError):
+        if cls._color_enabled is None:
+            try:
+                cls._color_enabled = not os.getenv('NO_COLOR') and os.isatty(sys.stdout.fileno())
+            except (AttributeError, OSError, ValueError):
+                cls._color_enabled = False
+        if not cls._color_enabled:
             return text
+        return f"{cls.COLORS.get(color, '')}{text}{cls.COLORS['reset']}"
+    
+    @classmethod
+    def reset_color_cache(cls) -> None:
+        """Re-detect color support on next output (e.g. after redirecting stdout)."""
+        cls._color_enabled = None
     
     @classmethod
     def print_message(cls, message: str, msg_type: MessageType = MessageType.INFO, 
                      prefix: str = "", bold: bool = False) -> None:
         """Print a formatted message to the user."""
-        symbol = cls.SYMBOLS.get(msg_type, "")
-        
-        # Choose color based on message type
-        color_map = {
-            MessageType.SUCCESS: 'green',
-            MessageType.WARNING: 'yellow', 
-            MessageType.ERROR: 'red',
-            MessageType.INFO: 'blue',
-            MessageType.PROMPT: 'cyan',
-            MessageType.HEADER: 'magenta',
-            MessageType.STEP: 'cyan'
-        }
-        
-        color = color_map.get(msg_type, 'reset')
+        # Choose symbol and color based on message type
+        symbol, color = cls._STYLE.get(msg_type, ("", 'reset'))
         formatted_text = f"{symbol} {prefix}{message}" if symbol else f"{prefix}{message}"
         
         if bold:
@@ -155,6 +163,8 @@ class UserMessenger:
 class ProgressBar:
     """Simple progress bar for long-running operations."""
     
+    MIN_REDRAW_INTERVAL = 0.05  # Seconds between redraws of an unchanged bar
+    
     def __init__(self, total: int, description: str = "Processing"):
         """
         Initialize progress bar.
@@ -163,11 +173,23 @@ class ProgressBar:
             total: Total number of items to process
             description: Description of the operation
         """
+        # Deferred so importing this module doesn't pay for time unless a bar is used
+        import time
+        
         self.total = total
         self.current = 0
         self.description = description
         self.start_time = time.time()
+        self._clock = time.monotonic
         self.bar_width = 40
+        
+        # Every possible bar rendering, indexed by filled width
+        self._bars = tuple('█' * i + '░' * (self.bar_width - i) for i in range(self.bar_width + 1))
+        
+        # Last drawn state, used to skip redundant redraws
+        self._last_draw_time = 0.0
+        self._last_percentage = -1
+        self._last_status = None
     
     def update(self, current: int, status: str = ""):
         """
@@ -178,23 +200,34 @@ class ProgressBar:
             status: Optional status message
         """
         self.current = current
+        total = self.total
         
         # Calculate progress percentage
-        if self.total > 0:
-            progress = min(current / self.total, 1.0)
+        if total > 0:
+            progress = min(current / total, 1.0)
         else:
             progress = 1.0
+        percentage = int(progress * 100)
+        
+        # Skip the redraw if nothing visible changed and the last one was recent
+        now = self._clock()
+        if (percentage == self._last_percentage and status == self._last_status
+                and now - self._last_draw_time < self.MIN_REDRAW_INTERVAL):
+            return
+        self._last_draw_time = now
+        self._last_percentage = percentage
+        self._last_status = status
         
         # Create progress bar
-        filled_width = int(self.bar_width * progress)
-        bar = '█' * filled_width + '░' * (self.bar_width - filled_width)
-        percentage = int(progress * 100)
+        bar = self._bars[int(self.bar_width * progress)]
         
         # Format status message
         status_msg = f" {status}" if status else ""
         
         # Print progress bar (overwrite previous line)
-        print(f"\r[{bar}] {percentage}% {self.description}{status_msg}", end='', flush=True)
+        stdout = sys.stdout
+        stdout.write(f"\r[{bar}] {percentage}% {self.description}{status_msg}")
+        stdout.flush()
     
     def complete(self, final_message: str = "Complete!"):
         """
@@ -204,7 +237,7 @@ class ProgressBar:
             final_message: Final completion message
         """
         # Show 100% completion
-        bar = '█' * self.bar_width
+        bar = self._bars[self.bar_width]
         print(f"\r[{bar}] 100% {final_message}")
     
     def increment(self, step: int = 1, status: str = ""):
@@ -245,25 +278,26 @@ class MenuSystem:
         else:
             display_title = title
         
-        # Top border
-        print(f"┌─ {display_title} {'─' * (box_width - len(display_title) - 3)}┐")
+        inner_width = box_width - 1
+        blank_line = f"│{' ' * inner_width}│"
         
-        # Empty line for spacing
-        print(f"│{' ' * (box_width - 1)}│")
+        # Top border and empty line for spacing
+        lines = [
+            f"┌─ {display_title} {'─' * (box_width - len(display_title) - 3)}┐",
+            blank_line
+        ]
         
         # Options
         for i, option in enumerate(options, 1):
-            print(f"│  {i}. {option}{' ' * (box_width - len(option) - 6)}│")
+            lines.append(f"│{f'  {i}. {option}'.ljust(inner_width)}│")
         
-        # Empty line before bottom
-        print(f"│{' ' * (box_width - 1)}│")
+        # Empty line before bottom, navigation options and bottom border
+        lines.append(blank_line)
+        lines.append(f"│{'  [B]ack  [E]xit'.ljust(inner_width)}│")
+        lines.append(f"└{'─' * inner_width}┘")
         
-        # Navigation options
-        nav_line = "  [B]ack  [E]xit"
-        print(f"│{nav_line}{' ' * (box_width - len(nav_line) - 1)}│")
-        
-        # Bottom border
-        print(f"└{'─' * (box_width - 1)}┘")
+        # Write the whole box at once so it renders atomically
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     @staticmethod
     def display_breadcrumb(steps: list, current_index: int):
@@ -299,31 +333,32 @@ class MenuSystem:
         Returns:
             User choice ('back', 'exit', or the selected number as string)
         """
-        valid_choices = [str(n) for n in valid_numbers]
+        valid_choices = frozenset(str(n) for n in valid_numbers)
         if allow_back:
-            valid_choices.extend(['b', 'back'])
+            valid_choices |= {'b', 'back'}
         if allow_exit:
-            valid_choices.extend(['e', 'exit'])
+            valid_choices |= {'e', 'exit'}
+        
+        # Build help message once
+        help_parts = [f"1-{max(valid_numbers)}"] if valid_numbers else []
+        if allow_back:
+            help_parts.append("B(ack)")
+        if allow_exit:
+            help_parts.append("E(xit)")
+        help_message = f" Please enter one of: {', '.join(help_parts)}"
         
         while True:
             choice = msg.get_user_input("Enter your choice", required=True).lower().strip()
             
             if choice in valid_choices:
-                if choice in ['b', 'back']:
+                if choice in ('b', 'back'):
                     return 'back'
-                elif choice in ['e', 'exit']:
+                elif choice in ('e', 'exit'):
                     return 'exit'
                 else:
                     return choice
             
-            # Build help message
-            help_parts = [f"1-{max(valid_numbers)}"]
-            if allow_back:
-                help_parts.append("B(ack)")
-            if allow_exit:
-                help_parts.append("E(xit)")
-            
-            msg.print_warning(f" Please enter one of: {', '.join(help_parts)}")
+            msg.print_warning(help_message)
 
 
 # Create global instances for easy access
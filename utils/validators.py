@@ -6,23 +6,47 @@ import re
 from datetime import datetime
 from typing import Optional
 
+# Characters not allowed in folder and file names
+_INVALID_FS_CHARS = '<>:"/\\|?*'
+_BAD_FS_CHARS = frozenset(_INVALID_FS_CHARS)
+
+# Patterns compiled once at import
+_RE_SIM_ID = re.compile(r'(Countdown-Premium-\d+)')
+_RE_EMAIL = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# Maps every character invalid in filenames to an underscore
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in _INVALID_FS_CHARS})
+
 
 class InputValidator:
     """Input validation utilities."""
     
     @staticmethod
-    def validate_date_format(date_str: str) -> bool:
-        """Validate date format (YYYY-MM)."""
-        try:
-            datetime.strptime(date_str, '%Y-%m')
-            return True
-        except ValueError:
+    def validate_date_format(date_str: str, strict: bool = False) -> bool:
+        """
+        Validate date format (YYYY-MM).
+        
+        Accepts the same ASCII inputs as datetime.strptime(date_str, '%Y-%m')
+        using plain string checks; pass strict=True to run strptime itself.
+        """
+        if strict:
+            try:
+                datetime.strptime(date_str, '%Y-%m')
+                return True
+            except ValueError:
+                return False
+        
+        year, sep, month = date_str.partition('-')
+        if not sep or len(year) != 4 or not 1 <= len(month) <= 2:
+            return False
+        if not (date_str.isascii() and year.isdigit() and month.isdigit()):
             return False
+        return int(year) >= 1 and 1 <= int(month) <= 12
     
     @staticmethod
     def validate_folder_name(name: str) -> bool:
         """Validate folder name doesn't contain invalid characters."""
-        return not re.search(r'[<>:"/\\|?*]', name)
+        return _BAD_FS_CHARS.isdisjoint(name)
     
     @staticmethod
     def validate_sim_id(sim_id: str) -> Optional[str]:
@@ -30,19 +54,18 @@ class InputValidator:
         if not sim_id:
             return ""
             
-        # Case 1: Just the number
+        # Case 1: Already proper format (the common case)
+        if sim_id.startswith("Countdown-Premium-"):
+            return sim_id
+        
+        # Case 2: Just the number
         if sim_id.isdigit():
             return f"Countdown-Premium-{sim_id}"
         
-        # Case 2: Full URL
-        if "issues.amazon.com" in sim_id:
-            match = re.search(r'(Countdown-Premium-\d+)', sim_id)
-            if match:
-                return match.group(1)
-        
-        # Case 3: Already proper format
-        if sim_id.startswith("Countdown-Premium-"):
-            return sim_id
+        # Case 3: Full URL (or any text) containing the SIM ID
+        match = _RE_SIM_ID.search(sim_id)
+        if match:
+            return match.group(1)
         
         # Invalid format
         return None
@@ -50,10 +73,9 @@ class InputValidator:
     @staticmethod
     def validate_email(email: str) -> bool:
         """Basic email validation."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return bool(re.match(pattern, email))
+        return bool(_RE_EMAIL.match(email))
     
     @staticmethod
     def sanitize_filename(filename: str) -> str:
         """Sanitize filename for safe file system usage."""
-        return re.sub(r'[<>:"/\\|?*]', '_', filename)
+        return filename.translate(_SANITIZE_TABLE)